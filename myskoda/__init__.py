@@ -1,29 +1,93 @@
 """A library for interacting with the MySkoda APIs."""
+# ruff: noqa: TC004  # The type-checking imports back the lazy exports below.
+
+from importlib import import_module
+from typing import TYPE_CHECKING
 
 from .__version__ import __version__
-from .auth.authorization import (
-    Authorization,
-    AuthorizationError,
-    AuthorizationFailedError,
-    IDKAuthorizationCode,
-    IDKSession,
-)
-from .models import (
-    air_conditioning,
-    charging,
-    common,
-    health,
-    info,
-    operation_request,
-    position,
-    service_event,
-    status,
-    user,
-)
-from .mqtt import MySkodaMqttClient
-from .myskoda import TRACE_CONFIG, MySkoda
-from .rest_api import RestApi
-from .vehicle import Vehicle
+
+if TYPE_CHECKING:
+    from .auth.authorization import (
+        Authorization,
+        AuthorizationError,
+        AuthorizationFailedError,
+        IDKAuthorizationCode,
+        IDKSession,
+    )
+    from .models import (
+        air_conditioning,
+        charging,
+        common,
+        health,
+        info,
+        operation_request,
+        position,
+        service_event,
+        status,
+        user,
+    )
+    from .mqtt import MySkodaMqttClient
+    from .myskoda import TRACE_CONFIG, MySkoda
+    from .rest_api import RestApi
+    from .vehicle import Vehicle
+
+# Exports are imported on first access (PEP 562), so that importing a single model module
+# does not pull in aiohttp, aiomqtt and the authorization flow.
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "Authorization": ".auth.authorization",
+    "AuthorizationError": ".auth.authorization",
+    "AuthorizationFailedError": ".auth.authorization",
+    "IDKAuthorizationCode": ".auth.authorization",
+    "IDKSession": ".auth.authorization",
+    "MySkodaMqttClient": ".mqtt",
+    "TRACE_CONFIG": ".myskoda",
+    "MySkoda": ".myskoda",
+    "RestApi": ".rest_api",
+    "Vehicle": ".vehicle",
+}
+_LAZY_MODULES: set[str] = {
+    "air_conditioning",
+    "charging",
+    "common",
+    "health",
+    "info",
+    "operation_request",
+    "position",
+    "service_event",
+    "status",
+    "user",
+}
+# Submodules that the eager imports used to bind as package attributes.
+_LAZY_SUBMODULES: set[str] = {
+    "anonymize",
+    "auth",
+    "const",
+    "event",
+    "models",
+    "mqtt",
+    "myskoda",
+    "rest_api",
+    "vehicle",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    elif name in _LAZY_MODULES:
+        value = import_module(f".models.{name}", __name__)
+    elif name in _LAZY_SUBMODULES:
+        value = import_module(f".{name}", __name__)
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     "TRACE_CONFIG",
@@ -1 +1,15 @@
 """Authorization for VW IDK servers."""
+
+from importlib import import_module
+from types import ModuleType
+
+
+def __getattr__(name: str) -> ModuleType:
+    if not name.startswith("_"):
+        try:
+            return import_module(f".{name}", __name__)
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -1 +1,17 @@
 """Pydantic models for all API responses."""
+
+from importlib import import_module
+from types import ModuleType
+
+
+def __getattr__(name: str) -> ModuleType:
+    # Import model modules on first attribute access, so `myskoda.models.info` works after
+    # `import myskoda` without loading every model up front (PEP 562).
+    if not name.startswith("_"):
+        try:
+            return import_module(f".{name}", __name__)
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import cache
 
 from mashumaro import field_options
 from mashumaro.mixins.orjson import DataClassORJSONMixin
@@ -16,11 +17,13 @@ class CaseInsensitiveStrEnum(StrEnum):
         """
         if not isinstance(value, str):
             raise TypeError
-        value = value.lower()
-        for member in cls:
-            if member.lower() == value:
-                return member
-        return None
+        return _members_by_lowercase_value(cls).get(value.lower())
+
+
+@cache
+def _members_by_lowercase_value(enum: type[StrEnum]) -> dict[str, StrEnum]:
+    """Build the case-insensitive lookup table for an enum once."""
+    return {member.lower(): member for member in enum}
 
 
 class OnOffState(StrEnum):
@@ -71,7 +74,7 @@ class Side(StrEnum):
     RIGHT = "RIGHT"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Coordinates(DataClassORJSONMixin):
     """GPS Coordinates."""
 
@@ -79,9 +82,9 @@ class Coordinates(DataClassORJSONMixin):
     longitude: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Address(DataClassORJSONMixin):
-    """A representation of a house-address."""
+    """A representation of a house-address. Immutable, so instances can be safely shared."""
 
     country_code: str = field(metadata=field_options(alias="countryCode"))
     zip_code: str | None = field(default=None, metadata=field_options(alias="zipCode"))
@@ -29,7 +29,7 @@ class Endpoint(StrEnum):
     ALL = "all"
 
 
-@dataclass
+@dataclass(slots=True)
 class FixtureReportGet(DataClassYAMLMixin):
     type: FixtureReportType
     vehicle_id: int
@@ -41,7 +41,7 @@ class FixtureReportGet(DataClassYAMLMixin):
     error: str | None = field(default=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class FixtureVehicle(DataClassYAMLMixin):
     id: int
     device_platform: str
@@ -50,7 +50,7 @@ class FixtureVehicle(DataClassYAMLMixin):
     model_year: str
     trim_level: str | None
     software_version: str | None
-    capabilities: list[Capability]
+    capabilities: tuple[Capability, ...]
 
 
 def create_fixture_vehicle(id: int, info: Info) -> FixtureVehicle:  # noqa: A002
@@ -59,7 +59,7 @@ def create_fixture_vehicle(id: int, info: Info) -> FixtureVehicle:  # noqa: A002
         id=id,
         device_platform=info.device_platform,
         system_model_id=info.specification.system_model_id,
-        capabilities=info.capabilities.capabilities,
+        capabilities=tuple(info.capabilities.capabilities),
         model=info.specification.model,
         model_year=info.specification.model_year,
         software_version=info.software_version,
@@ -67,7 +67,7 @@ def create_fixture_vehicle(id: int, info: Info) -> FixtureVehicle:  # noqa: A002
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Fixture(DataClassORJSONMixin, DataClassYAMLMixin):
     """A fixture for a test generated by the CLI."""
 
@@ -20,7 +20,7 @@ class GarageErrorType(StrEnum):
     MISSING_RENDER = "MISSING_RENDER"
 
 
-@dataclass
+@dataclass(slots=True)
 class GarageError(DataClassORJSONMixin):
     """Errors occurring in the Garage."""
 
@@ -28,7 +28,7 @@ class GarageError(DataClassORJSONMixin):
     type: GarageErrorType
 
 
-@dataclass
+@dataclass(slots=True)
 class GarageEntry(DataClassORJSONMixin):
     """One vehicle in the list of vehicles."""
 
@@ -45,7 +45,7 @@ class GarageEntry(DataClassORJSONMixin):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Garage(DataClassORJSONMixin):
     """Contents of the users Garage."""
 
@@ -1,5 +1,6 @@
 """Models for responses of api/v1/vehicle-health-report/warning-lights endpoint."""
 
+import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
@@ -7,6 +8,8 @@ from enum import StrEnum
 from mashumaro import field_options
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 
+_LOGGER = logging.getLogger(__name__)
+
 
 class WarningLightCategory(StrEnum):
     ASSISTANCE = "ASSISTANCE"
@@ -19,20 +22,36 @@ class WarningLightCategory(StrEnum):
     OTHER = "OTHER"
 
 
-@dataclass
+_WARNING_LIGHT_CATEGORY_BY_VALUE: dict[str, WarningLightCategory] = {
+    c.value: c for c in WarningLightCategory
+}
+
+
+def _deserialize_warning_light_category(value: str) -> WarningLightCategory:
+    """Map unknown categories to OTHER instead of failing the whole health report."""
+    category = _WARNING_LIGHT_CATEGORY_BY_VALUE.get(value)
+    if category is None:
+        _LOGGER.info("Unknown warning light category: %s", value)
+        return WarningLightCategory.OTHER
+    return category
+
+
+@dataclass(slots=True)
 class DefectDetails(DataClassORJSONMixin):
     text: str
     priority: str
     icon: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WarningLight(DataClassORJSONMixin):
-    category: WarningLightCategory
+    category: WarningLightCategory = field(
+        metadata=field_options(deserialize=_deserialize_warning_light_category)
+    )
     defects: list[DefectDetails]
 
 
-@dataclass
+@dataclass(slots=True)
 class Health(DataClassORJSONMixin):
     """Information about the car's health (currently only mileage)."""
 
@@ -118,7 +118,7 @@ class ErrorType(StrEnum):
     UNAVAILABLE_SERVICE_PLATFORM_CAPABILITIES = "UNAVAILABLE_SERVICE_PLATFORM_CAPABILITIES"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Error(DataClassORJSONMixin):
     """Main model for emitted errors."""
 
@@ -126,11 +126,14 @@ class Error(DataClassORJSONMixin):
     type: ErrorType
 
 
-@dataclass
+_CAPABILITY_BY_VALUE: dict[str, CapabilityId] = {c.value: c for c in CapabilityId}
+
+
+@dataclass(slots=True)
 class Capability(DataClassORJSONMixin, DataClassYAMLMixin):
     """Shows the status of a capability. Empty status indicates no error."""
 
-    id: CapabilityId
+    id: CapabilityId = field(metadata=field_options(deserialize=_CAPABILITY_BY_VALUE.__getitem__))
     statuses: list[CapabilityStatus]
 
     def is_available(self) -> bool:
@@ -143,13 +146,21 @@ class Capability(DataClassORJSONMixin, DataClassYAMLMixin):
 
 def drop_unknown_capabilities(value: list[dict]) -> list[Capability]:
     """Drop any unknown capabilities and log a message."""
-    unknown_capabilities = [c for c in value if c["id"] not in CapabilityId]
+    # Only collect the dropped entries when they will actually be logged.
+    log_unknown = _LOGGER.isEnabledFor(logging.INFO)
+    capabilities = []
+    unknown_capabilities = []
+    for c in value:
+        if c["id"] in _CAPABILITY_BY_VALUE:
+            capabilities.append(Capability.from_dict(c))
+        elif log_unknown:
+            unknown_capabilities.append(c)
     if unknown_capabilities:
         _LOGGER.info("Dropping unknown capabilities: %s", unknown_capabilities)
-    return [Capability.from_dict(c) for c in value if c["id"] in CapabilityId]
+    return capabilities
 
 
-@dataclass
+@dataclass(slots=True)
 class Capabilities(DataClassORJSONMixin):
     """Main Model for Capabilities.
 
@@ -160,9 +171,20 @@ class Capabilities(DataClassORJSONMixin):
         metadata=field_options(deserialize=drop_unknown_capabilities)
     )
     errors: list[Error] | None = field(default=None)
+    _by_id: dict[CapabilityId, Capability] = field(
+        init=False, repr=False, compare=False, metadata=field_options(serialize="omit")
+    )
+
+    def __post_init__(self) -> None:
+        """Index the capabilities by their id."""
+        self._by_id = {capability.id: capability for capability in self.capabilities}
+
+    def get(self, cap: CapabilityId) -> Capability | None:
+        """Return the capability with the given id, if the vehicle has it."""
+        return self._by_id.get(cap)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Battery(DataClassORJSONMixin):
     """Battery features."""
 
@@ -190,7 +212,7 @@ class VehicleState(StrEnum):
     RESET_SPIN = "RESET_SPIN"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Engine(DataClassORJSONMixin):
     """Engine features."""
 
@@ -201,14 +223,14 @@ class Engine(DataClassORJSONMixin):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Gearbox(DataClassORJSONMixin):
     """Gearbox features."""
 
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Specification(DataClassORJSONMixin):
     """Car specification. Model for the physical features of the car."""
 
@@ -227,7 +249,7 @@ class Specification(DataClassORJSONMixin):
     trim_level: str | None = field(default=None, metadata=field_options(alias="trimLevel"))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServicePartner(DataClassORJSONMixin):
     """ServicePartner is a fancy name for car dealer."""
 
@@ -248,7 +270,7 @@ class RenderType(StrEnum):
     REAL = "REAL"
 
 
-@dataclass
+@dataclass(slots=True)
 class Render(DataClassORJSONMixin):
     url: str
     type: RenderType
@@ -256,13 +278,13 @@ class Render(DataClassORJSONMixin):
     view_point: str = field(metadata=field_options(alias="viewPoint"))
 
 
-@dataclass
+@dataclass(slots=True)
 class CompositeRender(DataClassORJSONMixin):
     layers: list[Render]
     view_type: ViewType = field(metadata=field_options(alias="viewType"))
 
 
-@dataclass
+@dataclass(slots=True)
 class Info(DataClassORJSONMixin):
     """Basic vehicle information."""
 
@@ -292,7 +314,7 @@ class Info(DataClassORJSONMixin):
         Checks whether a vehicle generally has a capability.
         Does not check whether it's actually available.
         """
-        return any(capability.id == cap for capability in self.capabilities.capabilities)
+        return self.capabilities.get(cap) is not None
 
     def is_capability_available(self, cap: CapabilityId) -> bool:
         """Check for capability availability.
@@ -301,10 +323,9 @@ class Info(DataClassORJSONMixin):
         available. A capability can be unavailable for example if it's deactivated
         by the currently active user.
         """
-        return any(
-            capability.id == cap and capability.is_available()
-            for capability in self.capabilities.capabilities
-        )
+        capability = self.capabilities.get(cap)
+        # Same check as Capability.is_available, inlined to skip the method call.
+        return capability is not None and not capability.statuses
 
     def get_model_name(self) -> str:
         """Return the name of the vehicle's model."""
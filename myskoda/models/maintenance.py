@@ -10,7 +10,7 @@ from mashumaro.mixins.orjson import DataClassORJSONMixin
 from .common import Address, Coordinates, Weekday
 
 
-@dataclass
+@dataclass(slots=True)
 class MaintenanceReport(DataClassORJSONMixin):
     captured_at: datetime = field(metadata=field_options(alias="capturedAt"))
     mileage_in_km: int | None = field(default=None, metadata=field_options(alias="mileageInKm"))
@@ -28,20 +28,20 @@ class MaintenanceReport(DataClassORJSONMixin):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Contact(DataClassORJSONMixin):
     email: str | None = field(default=None)
     phone: str | None = field(default=None)
     url: str | None = field(default=None)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimeRange(DataClassORJSONMixin):
     start: time = field(metadata=field_options(alias="from"))
     end: time = field(metadata=field_options(alias="to"))
 
 
-@dataclass
+@dataclass(slots=True)
 class OpeningHoursPeriod(DataClassORJSONMixin):
     opening_times: list[TimeRange] = field(metadata=field_options(alias="openingTimes"))
     period_end: Weekday = field(metadata=field_options(alias="periodEnd"))
@@ -53,7 +53,7 @@ class CommunicationChannel(StrEnum):
     phone = "PHONE"
 
 
-@dataclass
+@dataclass(slots=True)
 class PredictiveMaintenanceSettings(DataClassORJSONMixin):
     email: str
     service_activated: bool = field(metadata=field_options(alias="serviceActivated"))
@@ -64,12 +64,12 @@ class PredictiveMaintenanceSettings(DataClassORJSONMixin):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class PredictiveMaintenance(DataClassORJSONMixin):
     setting: PredictiveMaintenanceSettings
 
 
-@dataclass
+@dataclass(slots=True)
 class ServicePartner(DataClassORJSONMixin):
     address: Address
     brand: str
@@ -81,7 +81,7 @@ class ServicePartner(DataClassORJSONMixin):
     partner_number: str = field(metadata=field_options(alias="partnerNumber"))
 
 
-@dataclass
+@dataclass(slots=True)
 class Maintenance(DataClassORJSONMixin):
     maintenance_report: MaintenanceReport | None = field(
         default=None, metadata=field_options(alias="maintenanceReport")
@@ -51,11 +51,21 @@ class OperationName(StrEnum):
     WINDOWS_HEATING = "windows-heating"
 
 
-@dataclass
+# Operation requests arrive with every MQTT operation message, so resolve the enums
+# with a plain dict lookup instead of going through the enum constructor.
+_OPERATION_NAME_BY_VALUE: dict[str, OperationName] = {o.value: o for o in OperationName}
+_OPERATION_STATUS_BY_VALUE: dict[str, OperationStatus] = {s.value: s for s in OperationStatus}
+
+
+@dataclass(slots=True)
 class OperationRequest(DataClassORJSONMixin):
     version: int
     trace_id: str = field(metadata=field_options(alias="traceId"))
     request_id: str = field(metadata=field_options(alias="requestId"))
-    operation: OperationName
-    status: OperationStatus
+    operation: OperationName = field(
+        metadata=field_options(deserialize=_OPERATION_NAME_BY_VALUE.__getitem__)
+    )
+    status: OperationStatus = field(
+        metadata=field_options(deserialize=_OPERATION_STATUS_BY_VALUE.__getitem__)
+    )
     error_code: str | None = field(default=None, metadata=field_options(alias="errorCode"))
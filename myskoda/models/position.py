@@ -13,7 +13,7 @@ class PositionType(StrEnum):
     VEHICLE = "VEHICLE"
 
 
-@dataclass
+@dataclass(slots=True)
 class Position(DataClassORJSONMixin):
     address: Address
     gps_coordinates: Coordinates = field(metadata=field_options(alias="gpsCoordinates"))
@@ -25,13 +25,13 @@ class ErrorType(StrEnum):
     VEHICLE_POSITION_UNAVAILABLE = "VEHICLE_POSITION_UNAVAILABLE"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Error(DataClassORJSONMixin):
     type: ErrorType
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Positions(DataClassORJSONMixin):
     """Positional information (GPS) for the vehicle and other things."""
 
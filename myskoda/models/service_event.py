@@ -3,7 +3,6 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
-from typing import Generic, TypeVar
 
 from mashumaro import field_options
 from mashumaro.mixins.orjson import DataClassORJSONMixin
@@ -27,7 +26,10 @@ class ServiceEventName(StrEnum):
     DEPARTURE_STATUS_CHANGED = "departure-status-changed"
 
 
-@dataclass
+_SERVICE_EVENT_NAME_BY_VALUE: dict[str, ServiceEventName] = {n.value: n for n in ServiceEventName}
+
+
+@dataclass(frozen=True, slots=True)
 class ServiceEventData(DataClassORJSONMixin):
     """Base class for data in service events."""
 
@@ -35,11 +37,8 @@ class ServiceEventData(DataClassORJSONMixin):
     vin: str
 
 
-T = TypeVar("T", bound=ServiceEventData)
-
-
-@dataclass
-class ServiceEvent(Generic[T], DataClassORJSONMixin):
+@dataclass(frozen=True, slots=True)
+class ServiceEvent(DataClassORJSONMixin):
     """Main model for Service Events.
 
     Service Events are unsolicited events emitted by the MQTT bus towards the client.
@@ -47,50 +46,47 @@ class ServiceEvent(Generic[T], DataClassORJSONMixin):
 
     version: int
     producer: str
-    name: ServiceEventName
-    data: T
+    name: ServiceEventName = field(
+        metadata=field_options(deserialize=_SERVICE_EVENT_NAME_BY_VALUE.__getitem__)
+    )
+    data: ServiceEventData
     trace_id: str = field(metadata=field_options(alias="traceId"))
     timestamp: datetime | None = field(default=None)
 
 
-def _deserialize_mode(value: str) -> ChargeMode:  # noqa: PLR0911
-    match value:
-        case "homeStorageCharging":
-            return ChargeMode.HOME_STORAGE_CHARGING
-        case "immediateDischarging":
-            return ChargeMode.IMMEDIATE_DISCHARGING
-        case "onlyOwnCurrent":
-            return ChargeMode.ONLY_OWN_CURRENT
-        case "preferredChargingTimes":
-            return ChargeMode.PREFERRED_CHARGING_TIMES
-        case "timerChargingWithClimatisation":
-            return ChargeMode.TIMER_CHARGING_WITH_CLIMATISATION
-        case "timer":
-            return ChargeMode.TIMER
-        case "manual":
-            return ChargeMode.MANUAL
-        case "off":
-            return ChargeMode.OFF
-        case _:
-            raise UnexpectedChargeModeError
+_CHARGE_MODE_BY_VALUE: dict[str, ChargeMode] = {
+    "homeStorageCharging": ChargeMode.HOME_STORAGE_CHARGING,
+    "immediateDischarging": ChargeMode.IMMEDIATE_DISCHARGING,
+    "onlyOwnCurrent": ChargeMode.ONLY_OWN_CURRENT,
+    "preferredChargingTimes": ChargeMode.PREFERRED_CHARGING_TIMES,
+    "timerChargingWithClimatisation": ChargeMode.TIMER_CHARGING_WITH_CLIMATISATION,
+    "timer": ChargeMode.TIMER,
+    "manual": ChargeMode.MANUAL,
+    "off": ChargeMode.OFF,
+}
+
+_CHARGING_STATE_BY_VALUE: dict[str, ChargingState] = {
+    "charging": ChargingState.CHARGING,
+    "chargePurposeReachedAndConservation": ChargingState.CONSERVING,
+    "chargePurposeReachedAndNotConservationCharging": ChargingState.READY_FOR_CHARGING,
+    "notReadyForCharging": ChargingState.CONNECT_CABLE,
+    "readyForCharging": ChargingState.READY_FOR_CHARGING,
+    "conserving": ChargingState.CONSERVING,
+}
+
+
+def _deserialize_mode(value: str) -> ChargeMode:
+    try:
+        return _CHARGE_MODE_BY_VALUE[value]
+    except KeyError:
+        raise UnexpectedChargeModeError from None
 
 
 def _deserialize_charging_state(value: str) -> ChargingState:
-    match value:
-        case "charging":
-            return ChargingState.CHARGING
-        case "chargePurposeReachedAndConservation":
-            return ChargingState.CONSERVING
-        case "chargePurposeReachedAndNotConservationCharging":
-            return ChargingState.READY_FOR_CHARGING
-        case "notReadyForCharging":
-            return ChargingState.CONNECT_CABLE
-        case "readyForCharging":
-            return ChargingState.READY_FOR_CHARGING
-        case "conserving":
-            return ChargingState.CONSERVING
-        case _:
-            raise UnexpectedChargingStateError
+    try:
+        return _CHARGING_STATE_BY_VALUE[value]
+    except KeyError:
+        raise UnexpectedChargingStateError from None
 
 
 def _deserialize_time_to_finish(value: int | str) -> int | None:
@@ -99,7 +95,7 @@ def _deserialize_time_to_finish(value: int | str) -> int | None:
     return int(value)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServiceEventChargingData(ServiceEventData):
     """Charging data inside charging service event change-soc."""
 
@@ -120,7 +116,7 @@ class ServiceEventChargingData(ServiceEventData):
     )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServiceEventWithChargingData(ServiceEvent):
     data: ServiceEventChargingData
 
@@ -14,7 +14,7 @@ class VerificationStatus(StrEnum):
     INCORRECT_SPIN = "INCORRECT_SPIN"
 
 
-@dataclass
+@dataclass(slots=True)
 class SpinStatus(DataClassORJSONMixin):
     state: str
     remaining_tries: int = field(metadata=field_options(alias="remainingTries"))
@@ -23,7 +23,7 @@ class SpinStatus(DataClassORJSONMixin):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Spin(DataClassORJSONMixin):
     verification_status: VerificationStatus = field(
         metadata=field_options(alias="verificationStatus")
@@ -4,7 +4,7 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import IntEnum
-from urllib.parse import parse_qs, urlparse
+from functools import lru_cache
 
 from mashumaro import field_options
 from mashumaro.mixins.orjson import DataClassORJSONMixin
@@ -34,14 +34,19 @@ class DoorWindowState(IntEnum):
     UNKNOWN = 0  # default state for invalid values
 
 
-@dataclass
+_DOOR_WINDOW_STATES: dict[int, DoorWindowState] = {
+    state.value: state for state in DoorWindowState if state is not DoorWindowState.UNKNOWN
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Detail(DataClassORJSONMixin):
     bonnet: OpenState
     sunroof: OpenState
     trunk: OpenState
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Overall(DataClassORJSONMixin):
     doors: OpenState
     doors_locked: DoorLockedState = field(metadata=field_options(alias="doorsLocked"))
@@ -50,7 +55,7 @@ class Overall(DataClassORJSONMixin):
     windows: OpenState
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RenderMode(DataClassORJSONMixin):
     one_x: str = field(metadata=field_options(alias="oneX"))
     one_and_half_x: str = field(metadata=field_options(alias="oneAndHalfX"))
@@ -58,13 +63,70 @@ class RenderMode(DataClassORJSONMixin):
     three_x: str = field(metadata=field_options(alias="threeX"))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Renders(DataClassORJSONMixin):
     light_mode: RenderMode = field(metadata=field_options(alias="lightMode"))
     dark_mode: RenderMode = field(metadata=field_options(alias="darkMode"))
 
 
-@dataclass
+# The doors are the first elements of the vehicleState parameter in the renders url.
+_DOOR_COUNT = 4
+
+# Element states in the renders url are single digits, so skip int() for the common case.
+_SINGLE_DIGITS: dict[str, int] = {str(digit): digit for digit in range(10)}
+
+
+def _get_query_parameter(url: str, name: str) -> str | None:
+    """Return the first value of a query parameter in the url.
+
+    Only the query is scanned; the vehicle renders urls never need percent-decoding.
+    """
+    _, _, query = url.partition("?")
+    for parameter in query.split("&"):
+        key, _, value = parameter.partition("=")
+        if key == name:
+            return value
+    return None
+
+
+@lru_cache(maxsize=128)
+def _extract_window_door_states_from_url(url: str) -> tuple[int, ...]:
+    """Extract window/door states from renders url.
+
+    The url only changes when the vehicle state does, so repeated polls of an unchanged
+    vehicle are served from the cache.
+
+    Returns:
+       States of doors/windows as a tuple of integers, other elements states are
+       ignored since they are available directly in detail or overall fields.
+
+    """
+    # Only the first four elements (the doors) are needed, so don't split the rest.
+    vehicle_state = _get_query_parameter(url, "vehicleState")
+    values = vehicle_state.split("-", _DOOR_COUNT)[:_DOOR_COUNT] if vehicle_state else []
+    if len(values) < _DOOR_COUNT:
+        # Return default if mapping fails
+        _LOGGER.error("Unable to deduct doors/windows state from vehicle status url")
+        return (0, 0, 0, 0)
+
+    # Convert values to integers, replacing invalid ones with default
+    integer_map = []
+    invalid_values = []
+    for value in values:
+        state = _SINGLE_DIGITS.get(value)
+        if state is None:
+            if value.isascii() and value.isdigit():
+                state = int(value)
+            else:
+                invalid_values.append(value)
+                state = 0  # Default to UNKNOWN state
+        integer_map.append(state)
+    if invalid_values:
+        _LOGGER.warning("Invalid DoorWindowState: %s, defaulting to UNKNOWN", invalid_values)
+    return tuple(integer_map)
+
+
+@dataclass(frozen=True, slots=True)
 class Status(DataClassORJSONMixin):
     """Current status information for a vehicle."""
 
@@ -74,45 +136,25 @@ class Status(DataClassORJSONMixin):
     car_captured_timestamp: datetime | None = field(
         default=None, metadata=field_options(alias="carCapturedTimestamp")
     )
+    _door_window_states: tuple[int, ...] = field(
+        init=False,
+        repr=False,
+        compare=False,
+        metadata=field_options(serialize="omit"),
+    )
 
-    def _extract_window_door_state_list_from_url(self) -> list[int]:
-        """Extract window/door states from renders url.
-
-        Returns:
-           States of doors/windows as a list of integers, other elements states are
-           ignored since they are available directly in detail or overall fields.
-
-        """
-        try:
-            parsed_url = urlparse(self.renders.light_mode.one_x)
-            parsed_query = parse_qs(parsed_url.query)
-            split_values = parsed_query["vehicleState"][0].split("-")
-
-            # Convert values to integers, replacing invalid ones with default
-            integer_map = []
-            for value in split_values:
-                try:
-                    integer_map.append(int(value))
-                except ValueError:
-                    _LOGGER.warning("Invalid DoorWindowState: '%s', defaulting to UNKNOWN", value)
-                    integer_map.append(0)  # Default to UNKNOWN state
-        except (IndexError, KeyError, ValueError):
-            # Return default if mapping fails
-            _LOGGER.exception("Unable to deduct doors/windows state from vehicle status url")
-            return [0, 0, 0, 0]
-        return integer_map[:4]
+    def __post_init__(self) -> None:
+        """Parse the door and window states from the renders url once."""
+        object.__setattr__(
+            self,
+            "_door_window_states",
+            _extract_window_door_states_from_url(self.renders.light_mode.one_x),
+        )
 
     def _get_door_window_state(self, element: CarBodyElements) -> DoorWindowState:
-        door_states = self._extract_window_door_state_list_from_url()
-        state = door_states[element.value]
-        if state in (
-            DoorWindowState.CLOSED,
-            DoorWindowState.DOOR_OPEN,
-            DoorWindowState.WINDOW_OPEN,
-            DoorWindowState.ALL_OPEN,
-        ):
-            return state
-        return DoorWindowState.UNKNOWN
+        # CarBodyElements is an IntEnum, so it indexes directly; .value is a slow descriptor.
+        state = self._door_window_states[element]
+        return _DOOR_WINDOW_STATES.get(state, DoorWindowState.UNKNOWN)
 
     @property
     def left_front_door(self) -> DoorWindowState:
@@ -3,8 +3,10 @@
 from dataclasses import dataclass, field
 from datetime import date
 from enum import StrEnum
+from functools import lru_cache
 
 from mashumaro import field_options
+from mashumaro.config import BaseConfig
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 
 
@@ -15,7 +17,11 @@ class VehicleType(StrEnum):
     GAS = "GAS"
 
 
-@dataclass
+# Consecutive polls return mostly the same days, so share the parsed dates between them.
+_parse_date = lru_cache(maxsize=512)(date.fromisoformat)
+
+
+@dataclass(slots=True)
 class StatisticsEntry(DataClassORJSONMixin):
     date: date
     average_fuel_consumption: float | None = field(
@@ -42,8 +48,13 @@ class StatisticsEntry(DataClassORJSONMixin):
     )
     trip_ids: list[int] | None = field(default=None, metadata=field_options(alias="tripIds"))
 
+    class Config(BaseConfig):
+        """Configuration for serialization and deserialization.."""
+
+        serialization_strategy = {date: {"deserialize": _parse_date}}  # noqa: RUF012
+
 
-@dataclass
+@dataclass(slots=True)
 class TripStatistics(DataClassORJSONMixin):
     vehicle_type: VehicleType = field(metadata=field_options(alias="vehicleType"))
     detailed_statistics: list[StatisticsEntry] = field(
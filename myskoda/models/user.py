@@ -22,20 +22,31 @@ class UserCapabilityId(StrEnum):
     TEST_DRIVE = "TEST_DRIVE"
 
 
-@dataclass
+_USER_CAPABILITY_BY_VALUE: dict[str, UserCapabilityId] = {c.value: c for c in UserCapabilityId}
+
+
+@dataclass(slots=True)
 class UserCapability(DataClassORJSONMixin):
     id: UserCapabilityId
 
 
 def drop_unknown_capabilities(value: list[dict]) -> list[UserCapability]:
     """Drop any unknown usercapabilities and log a message."""
-    unknown_capabilities = [c for c in value if c["id"] not in UserCapabilityId]
+    capabilities = []
+    unknown_capabilities = []
+    for c in value:
+        capability_id = _USER_CAPABILITY_BY_VALUE.get(c["id"])
+        if capability_id is None:
+            unknown_capabilities.append(c)
+        else:
+            # The id is the only field, so construct directly instead of via from_dict.
+            capabilities.append(UserCapability(id=capability_id))
     if unknown_capabilities:
         _LOGGER.info("Dropping unknown capabilities: %s", unknown_capabilities)
-    return [UserCapability.from_dict(c) for c in value if c["id"] in UserCapabilityId]
+    return capabilities
 
 
-@dataclass
+@dataclass(slots=True)
 class User(DataClassORJSONMixin):
     capabilities: list[UserCapability] = field(
         metadata=field_options(deserialize=drop_unknown_capabilities)
@@ -5,7 +5,6 @@ Inspired by https://github.com/YoSmart-Inc/yolink-api/tree/main
 
 import asyncio
 import logging
-import re
 import ssl
 import uuid
 from collections.abc import Awaitable, Callable
@@ -44,7 +43,8 @@ from .event import (
 from .models.operation_request import OperationName, OperationRequest, OperationStatus
 
 _LOGGER = logging.getLogger(__name__)
-TOPIC_RE = re.compile("^(.*?)/(.*?)/(.*?)/(.*?)$")
+_TOPIC_PARTS = 4  # user_id, vin, event type and the topic path
+_EVENT_TYPE_BY_VALUE = {event_type.value: event_type for event_type in EventType}
 app_uuid = uuid.uuid4()
 
 
@@ -55,22 +55,34 @@ def _create_ssl_context() -> ssl.SSLContext:
     return context
 
 
-_SSL_CONTEXT = _create_ssl_context()
+_SSL_CONTEXT: ssl.SSLContext | None = None
 
-background_tasks = set()
 
+async def _get_ssl_context() -> ssl.SSLContext:
+    """Return the shared SSL context, loading the default certificates off the event loop once."""
+    global _SSL_CONTEXT  # noqa: PLW0603
+    if _SSL_CONTEXT is None:
+        _SSL_CONTEXT = await asyncio.to_thread(_create_ssl_context)
+    return _SSL_CONTEXT
 
-class OperationListener:
-    """Used to track callbacks to execute for a given OperationName."""
 
-    operation_name: OperationName
-    future: asyncio.Future[OperationRequest]
+def _get_charging_event(data: bytes) -> ServiceEvent:
+    try:
+        event = ServiceEventWithChargingData.from_json(data)
+    except ValueError:
+        event = ServiceEvent.from_json(data)
+    return event
 
-    def __init__(  # noqa: D107
-        self, operation_name: OperationName, future: asyncio.Future[OperationRequest]
-    ) -> None:
-        self.operation_name = operation_name
-        self.future = future
+
+# Service event topics mapped to the event class and payload parser for that topic.
+_SERVICE_EVENTS: dict[str, tuple[Callable[..., Event], Callable[[bytes], ServiceEvent]]] = {
+    "air-conditioning": (EventAirConditioning, ServiceEvent.from_json),
+    "auxiliary-heating": (EventAuxiliaryHeating, ServiceEvent.from_json),
+    "charging": (EventCharging, _get_charging_event),
+    "departure": (EventDeparture, ServiceEvent.from_json),
+    "vehicle-status/access": (EventAccess, ServiceEvent.from_json),
+    "vehicle-status/lights": (EventLights, ServiceEvent.from_json),
+}
 
 
 class OperationFailedError(Exception):
@@ -84,8 +96,10 @@ class OperationFailedError(Exception):
 class MySkodaMqttClient:
     user_id: str | None
     vehicle_vins: list[str]
+    _topics: list[tuple[str, int]]
     _callbacks: list[Callable[[Event], None | Awaitable[None]]]
-    _operation_listeners: list[OperationListener]
+    _operation_listeners: dict[OperationName, list[asyncio.Future[OperationRequest]]]
+    _background_tasks: set[asyncio.Task[Any]]
 
     def __init__(  # noqa: D107
         self,
@@ -98,9 +112,11 @@ class MySkodaMqttClient:
         self.hostname = hostname
         self.port = port
         self.vehicle_vins = []
+        self._topics = []
         self.enable_ssl = enable_ssl
         self._callbacks = []
-        self._operation_listeners = []
+        self._operation_listeners = {}
+        self._background_tasks = set()
         self._listener_task = None
         self._running = False
         self._subscribed = asyncio.Event()
@@ -111,7 +127,9 @@ class MySkodaMqttClient:
         _LOGGER.info("Connecting to MQTT with %s/%s", user_id, vehicle_vins)
         self.user_id = user_id
         self.vehicle_vins = vehicle_vins
-        self._listener_task = asyncio.create_task(self._connect_and_listen())
+        self._topics = [(topic, 0) for topic in self._build_topics(user_id, vehicle_vins)]
+        tls_context = await _get_ssl_context() if self.enable_ssl else None
+        self._listener_task = asyncio.create_task(self._connect_and_listen(tls_context))
         await self._subscribed.wait()
 
     async def disconnect(self) -> None:
@@ -131,11 +149,21 @@ class MySkodaMqttClient:
         _LOGGER.debug("Waiting for operation %s complete.", operation_name)
         future: asyncio.Future[OperationRequest] = asyncio.get_event_loop().create_future()
 
-        self._operation_listeners.append(OperationListener(operation_name, future))
+        self._operation_listeners.setdefault(operation_name, []).append(future)
 
         return future
 
-    async def _connect_and_listen(self) -> None:
+    @staticmethod
+    def _build_topics(user_id: str, vehicle_vins: list[str]) -> list[str]:
+        """Return the topics to subscribe to for the given user_id and VINs."""
+        topics = []
+        for vin in vehicle_vins:
+            topics += [f"{user_id}/{vin}/operation-request/{t}" for t in MQTT_OPERATION_TOPICS]
+            topics += [f"{user_id}/{vin}/service-event/{t}" for t in MQTT_SERVICE_EVENT_TOPICS]
+            topics += [f"{user_id}/{vin}/account-event/{t}" for t in MQTT_ACCOUNT_EVENT_TOPICS]
+        return topics
+
+    async def _connect_and_listen(self, tls_context: ssl.SSLContext | None) -> None:
         """Connect to the MQTT broker and listen for messages for the given user_id and VINs.
 
         Reconnect loop based on https://github.com/empicano/aiomqtt/blob/main/docs/reconnection.md.
@@ -160,21 +188,15 @@ class MySkodaMqttClient:
                     identifier=client_id,
                     password=await self.authorization.get_access_token(),
                     logger=_LOGGER,
-                    tls_context=_SSL_CONTEXT if self.enable_ssl else None,
+                    tls_context=tls_context,
                     keepalive=MQTT_KEEPALIVE,
                     clean_session=True,
                 ) as client:
                     _LOGGER.info("Connected to MQTT")
                     _LOGGER.debug("using MQTT client %s", client)
-                    for vin in self.vehicle_vins:
-                        for topic in MQTT_OPERATION_TOPICS:
-                            await client.subscribe(
-                                f"{self.user_id}/{vin}/operation-request/{topic}"
-                            )
-                        for topic in MQTT_SERVICE_EVENT_TOPICS:
-                            await client.subscribe(f"{self.user_id}/{vin}/service-event/{topic}")
-                        for topic in MQTT_ACCOUNT_EVENT_TOPICS:
-                            await client.subscribe(f"{self.user_id}/{vin}/account-event/{topic}")
+                    # Subscribe to all topics with a single SUBSCRIBE packet.
+                    if self._topics:
+                        await client.subscribe(self._topics)
 
                     self._subscribed.set()
                     self._reconnect_delay = MQTT_RECONNECT_DELAY
@@ -200,105 +222,61 @@ class MySkodaMqttClient:
         """Deserialize received MQTT message and emit Event to subscribed callbacks."""
         # Extract the topic, user id and vin from the topic's name.
         # Internally, the topic will always look like this:
-        # `/{user_id}/{vin}/path/to/topic`
-        topic_match = TOPIC_RE.match(str(msg.topic))
-        if not topic_match:
-            _LOGGER.warning("Unexpected MQTT topic encountered: %s", topic_match)
+        # `{user_id}/{vin}/{event_type}/path/to/topic`
+        # The path may itself contain slashes, so only the first three separators are split on.
+        topic_parts = str(msg.topic).split("/", _TOPIC_PARTS - 1)
+        if len(topic_parts) != _TOPIC_PARTS:
+            _LOGGER.warning("Unexpected MQTT topic encountered: %s", msg.topic)
             return
 
-        # Cast the data from binary string, ignoring empty messages.
-        data = cast(str, msg.payload)
-        if len(data) == 0:
+        # Received payloads are raw bytes, which are parsed as JSON without decoding them first.
+        # Empty messages are ignored.
+        data = msg.payload
+        if not isinstance(data, bytes) or not data:
             return
 
-        self._parse_topic(topic_match, data)
+        self._parse_topic(topic_parts, data, datetime.now(tz=UTC))
 
-    @staticmethod
-    def _get_charging_event(data: str) -> ServiceEvent:
-        try:
-            event = ServiceEventWithChargingData.from_json(data)
-        except ValueError:
-            event = ServiceEvent.from_json(data)
-        return event
+    def _parse_topic(self, topic_parts: list[str], data: bytes, timestamp: datetime) -> None:
+        """Parse the topic and extract relevant parts.
 
-    def _parse_topic(self, topic_match: re.Match[str], data: str) -> None:
-        """Parse the topic and extract relevant parts."""
-        [user_id, vin, event_type, topic] = topic_match.groups()
-        event_type = EventType(event_type)
+        All events built from one message share the given receive timestamp.
+        """
+        [user_id, vin, event_type_value, topic] = topic_parts
+        event_type = _EVENT_TYPE_BY_VALUE.get(event_type_value)
+        if event_type is None:
+            _LOGGER.warning("Unexpected MQTT event type encountered: %s", event_type_value)
+            return
 
         _LOGGER.debug("Message (%s) received for %s on topic %s: %s", event_type, vin, topic, data)
 
         # Messages will contain payload as JSON.
         try:
-            if event_type == EventType.OPERATION:
+            if event_type is EventType.OPERATION:
                 self._emit(
                     EventOperation(
                         vin=vin,
                         user_id=user_id,
-                        timestamp=datetime.now(tz=UTC),
+                        timestamp=timestamp,
                         operation=OperationRequest.from_json(data),
                     )
                 )
-            elif event_type == EventType.ACCOUNT_EVENT:
+            elif event_type is EventType.ACCOUNT_EVENT:
                 self._emit(
                     EventAccountPrivacy(
                         vin=vin,
                         user_id=user_id,
-                        timestamp=datetime.now(tz=UTC),
-                    )
-                )
-            elif event_type == EventType.SERVICE_EVENT and topic == "air-conditioning":
-                self._emit(
-                    EventAirConditioning(
-                        vin=vin,
-                        user_id=user_id,
-                        timestamp=datetime.now(tz=UTC),
-                        event=ServiceEvent.from_json(data),
-                    )
-                )
-            elif event_type == EventType.SERVICE_EVENT and topic == "auxiliary-heating":
-                self._emit(
-                    EventAuxiliaryHeating(
-                        vin=vin,
-                        user_id=user_id,
-                        timestamp=datetime.now(tz=UTC),
-                        event=ServiceEvent.from_json(data),
+                        timestamp=timestamp,
                     )
                 )
-            elif event_type == EventType.SERVICE_EVENT and topic == "charging":
+            elif event_type is EventType.SERVICE_EVENT and topic in _SERVICE_EVENTS:
+                event_class, parse_event = _SERVICE_EVENTS[topic]
                 self._emit(
-                    EventCharging(
+                    event_class(
                         vin=vin,
                         user_id=user_id,
-                        timestamp=datetime.now(tz=UTC),
-                        event=self._get_charging_event(data),
-                    )
-                )
-            elif event_type == EventType.SERVICE_EVENT and topic == "departure":
-                self._emit(
-                    EventDeparture(
-                        vin=vin,
-                        user_id=user_id,
-                        timestamp=datetime.now(tz=UTC),
-                        event=ServiceEvent.from_json(data),
-                    )
-                )
-            elif event_type == EventType.SERVICE_EVENT and topic == "vehicle-status/access":
-                self._emit(
-                    EventAccess(
-                        vin=vin,
-                        user_id=user_id,
-                        timestamp=datetime.now(tz=UTC),
-                        event=ServiceEvent.from_json(data),
-                    )
-                )
-            elif event_type == EventType.SERVICE_EVENT and topic == "vehicle-status/lights":
-                self._emit(
-                    EventLights(
-                        vin=vin,
-                        user_id=user_id,
-                        timestamp=datetime.now(tz=UTC),
-                        event=ServiceEvent.from_json(data),
+                        timestamp=timestamp,
+                        event=parse_event(data),
                     )
                 )
         except Exception as exc:  # noqa: BLE001
@@ -309,16 +287,22 @@ class MySkodaMqttClient:
             result = callback(event)
             if result is not None:
                 task = asyncio.create_task(cast(Any, result))
-                background_tasks.add(task)
-                task.add_done_callback(background_tasks.discard)
+                self._background_tasks.add(task)
+                task.add_done_callback(self._on_callback_done)
 
         self._handle_operation(event)
 
+    def _on_callback_done(self, task: asyncio.Task[Any]) -> None:
+        """Release a finished callback task and log the exception it raised, if any."""
+        self._background_tasks.discard(task)
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            _LOGGER.error("Exception in MQTT event callback", exc_info=exc)
+
     def _handle_operation(self, event: Event) -> None:
-        if event.type != EventType.OPERATION:
+        if event.type is not EventType.OPERATION:
             return
 
-        if event.operation.status == OperationStatus.IN_PROGRESS:
+        if event.operation.status is OperationStatus.IN_PROGRESS:
             _LOGGER.debug(
                 "An operation '%s' is now in progress. Trace id: %s",
                 event.operation.operation,
@@ -334,23 +318,20 @@ class MySkodaMqttClient:
         self._handle_operation_completed(event.operation)
 
     def _handle_operation_completed(self, operation: OperationRequest) -> None:
-        listeners = self._operation_listeners
-        self._operation_listeners = []
-        for listener in listeners:
-            if listener.operation_name != operation.operation:
-                self._operation_listeners.append(listener)
+        for future in self._operation_listeners.pop(operation.operation, []):
+            if future.done():  # The waiter was cancelled, e.g. by a timeout.
                 continue
 
-            if operation.status == OperationStatus.ERROR:
+            if operation.status is OperationStatus.ERROR:
                 _LOGGER.error(
                     "Resolving listener for operation '%s' with error '%s'.",
                     operation.operation,
                     operation.error_code,
                 )
-                listener.future.set_exception(OperationFailedError(operation))
+                future.set_exception(OperationFailedError(operation))
             else:
-                if operation.status == OperationStatus.COMPLETED_WARNING:
+                if operation.status is OperationStatus.COMPLETED_WARNING:
                     _LOGGER.warning("Operation '%s' completed with warnings.", operation.operation)
 
                 _LOGGER.debug("Resolving listener for operation '%s'.", operation.operation)
-                listener.future.set_result(operation)
+                future.set_result(operation)
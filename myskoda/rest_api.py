@@ -95,9 +95,9 @@ class RestApi:
                     headers=await self._headers(),
                     json=json,
                 ) as response:
-                    await response.text()  # Ensure response is fully read
+                    text = await response.text()  # Ensure response is fully read
                     response.raise_for_status()
-                    return await response.text()
+                    return text
         except TimeoutError:
             _LOGGER.exception("Timeout while sending %s request to %s", method, url)
             raise
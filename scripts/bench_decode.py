@@ -0,0 +1,78 @@
+"""Benchmark decoding of the recorded fixture responses.
+
+Run with `python -m scripts.bench_decode [endpoint ...]` from the repository root.
+"""
+
+import sys
+import timeit
+from collections import defaultdict
+from collections.abc import Callable
+from pathlib import Path
+
+from myskoda.models.air_conditioning import AirConditioning
+from myskoda.models.auxiliary_heating import AuxiliaryHeating
+from myskoda.models.charging import Charging
+from myskoda.models.departure import DepartureInfo
+from myskoda.models.driving_range import DrivingRange
+from myskoda.models.fixtures import Endpoint, Fixture
+from myskoda.models.health import Health
+from myskoda.models.info import Info
+from myskoda.models.maintenance import Maintenance
+from myskoda.models.position import Positions
+from myskoda.models.status import Status
+from myskoda.models.trip_statistics import TripStatistics
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+DECODERS: dict[Endpoint, Callable[[str], object]] = {
+    Endpoint.INFO: Info.from_json,
+    Endpoint.STATUS: Status.from_json,
+    Endpoint.AIR_CONDITIONING: AirConditioning.from_json,
+    Endpoint.AUXILIARY_HEATING: AuxiliaryHeating.from_json,
+    Endpoint.POSITIONS: Positions.from_json,
+    Endpoint.HEALTH: Health.from_json,
+    Endpoint.CHARGING: Charging.from_json,
+    Endpoint.MAINTENANCE: Maintenance.from_json,
+    Endpoint.DRIVING_RANGE: DrivingRange.from_json,
+    Endpoint.TRIP_STATISTICS: TripStatistics.from_json,
+    Endpoint.DEPARTURE_INFO: DepartureInfo.from_json,
+}
+
+
+def load_payloads() -> dict[Endpoint, list[str]]:
+    """Collect the raw responses of all successful fixture reports by endpoint."""
+    payloads: dict[Endpoint, list[str]] = defaultdict(list)
+    for file in sorted(FIXTURES_DIR.glob("**/*.yaml")):
+        fixture = Fixture.from_yaml(file.read_text())
+        for report in fixture.reports or []:
+            if report.success and report.raw is not None:
+                payloads[report.endpoint].append(report.raw)
+    return payloads
+
+
+def bench(endpoint: Endpoint, payloads: list[str]) -> float:
+    """Return the mean time in microseconds to decode one payload."""
+    decode = DECODERS[endpoint]
+
+    def run() -> None:
+        for raw in payloads:
+            decode(raw)
+
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=5, number=number))
+    return best / number / len(payloads) * 1e6
+
+
+def main(args: list[str]) -> None:
+    endpoints = [Endpoint(arg) for arg in args] or list(DECODERS)
+    payloads = load_payloads()
+    for endpoint in endpoints:
+        if not payloads[endpoint]:
+            continue
+        mean = bench(endpoint, payloads[endpoint])
+        print(f"{endpoint:<20} {len(payloads[endpoint]):>4} payloads {mean:>10.1f} us/decode")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,28 @@
+"""Unit tests for myskoda.models.health."""
+
+import logging
+
+import pytest
+
+from myskoda.models.health import Health, WarningLightCategory
+
+
+def test_unknown_warning_light_category_maps_to_other(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that an unknown category does not fail the health report."""
+    health_json = {
+        "capturedAt": "2024-10-14T10:05:21.000Z",
+        "mileageInKm": 12345,
+        "warningLights": [
+            {"category": "ENGINE", "defects": []},
+            {"category": "FUEL_SYSTEM", "defects": [{"text": "Check fuel", "priority": "HIGH"}]},
+        ],
+    }
+
+    with caplog.at_level(logging.INFO, logger="myskoda.models.health"):
+        health = Health.from_dict(health_json)
+
+    assert [light.category for light in health.warning_lights] == [
+        WarningLightCategory.ENGINE,
+        WarningLightCategory.OTHER,
+    ]
+    assert "Unknown warning light category: FUEL_SYSTEM" in caplog.text
@@ -0,0 +1,30 @@
+"""Unit tests for the lazy exports of the myskoda package."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "attribute",
+    [
+        "MySkoda",
+        "MySkodaMqttClient",
+        "Authorization",
+        "info",
+        "models.info",
+        "models.garage",
+        "auth.authorization",
+        "event",
+        "mqtt",
+        "myskoda",
+        "rest_api",
+        "vehicle",
+    ],
+)
+def test_attribute_access_in_fresh_interpreter(attribute: str) -> None:
+    """Test that exports and submodules resolve on first access after `import myskoda`."""
+    name = attribute.split(".")[0]
+    code = f"import myskoda; myskoda.{attribute}; assert {name!r} in dir(myskoda)"
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
@@ -1,7 +1,7 @@
 """Unit tests for MQTT."""
 
 import json
-from asyncio import get_event_loop
+from asyncio import get_event_loop, sleep
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import ANY
@@ -291,3 +291,38 @@ async def test_subscribe_event(
             ),
         ),
     ]
+
+
+@pytest.mark.asyncio
+async def test_async_callback_exception_is_logged(
+    mqtt_client: MQTTClient,
+    myskoda: MySkoda,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    future = get_event_loop().create_future()
+
+    async def on_event(_event: Event) -> None:
+        future.set_result(None)
+        msg = "callback failed"
+        raise RuntimeError(msg)
+
+    myskoda.subscribe(on_event)
+
+    await mqtt_client.publish(
+        f"{USER_ID}/{VIN}/service-event/vehicle-status/lights",
+        json.dumps(
+            {
+                "version": 1,
+                "traceId": "7a59299d06535a6756d10e96e0c75ed3",
+                "timestamp": "2024-10-28T08:33:40.232Z",
+                "producer": "SKODA_MHUB",
+                "name": "change-lights",
+                "data": {"userId": USER_ID, "vin": VIN},
+            }
+        ).encode("utf-8"),
+        QOS_2,
+    )
+    await future
+    await sleep(0)
+
+    assert "Exception in MQTT event callback" in caplog.text
@@ -9,6 +9,7 @@ from aioresponses import aioresponses
 
 from myskoda.models.common import OpenState
 from myskoda.models.departure import DepartureInfo
+from myskoda.models.info import CapabilityId
 from myskoda.models.status import DoorWindowState
 from myskoda.models.trip_statistics import VehicleType
 from myskoda.myskoda import MySkoda
@@ -54,6 +55,13 @@ async def test_get_info(
         # Should probably assert the whole thing. Just an example.
         assert get_info_result.name == vehicle_info_json["name"]
 
+        for capability in vehicle_info_json["capabilities"]["capabilities"]:
+            if capability["id"] not in CapabilityId:
+                continue
+            cap = CapabilityId(capability["id"])
+            assert get_info_result.has_capability(cap)
+            assert get_info_result.is_capability_available(cap) == (not capability["statuses"])
+
 
 @pytest.fixture(name="vehicle_statuses")
 def load_vehicle_status() -> list[str]:
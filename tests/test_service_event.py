@@ -4,6 +4,7 @@ This module partially repeats test_mqtt.py tests but is more isolated:
 here we have unit tests for service_event module only.
 """
 
+import pickle
 from pathlib import Path
 
 import pytest
@@ -78,3 +79,17 @@ def test_parse_service_events(service_events: list[str]) -> None:
                 user_id=f"ad0d7945-4814-43d0-801f-{event.name.value}",
                 vin="TMBAXXXXXXXXXXXXX",
             )
+
+
+def test_service_events_deduplicate(service_events: list[str]) -> None:
+    charging_events = service_events[:3]
+    events = [ServiceEvent.from_json(service_event) for service_event in service_events] + [
+        ServiceEventWithChargingData.from_json(service_event) for service_event in charging_events
+    ]
+    duplicates = [ServiceEvent.from_json(service_event) for service_event in service_events] + [
+        ServiceEventWithChargingData.from_json(service_event) for service_event in charging_events
+    ]
+    unpickled = pickle.loads(pickle.dumps(events))  # noqa: S301
+
+    assert len(set(events)) == len(events)
+    assert set(events + duplicates + unpickled) == set(events)
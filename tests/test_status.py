@@ -1,6 +1,7 @@
 """Unit tests for myskoda.models.status."""
 
 import json
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
 import pytest
@@ -123,3 +124,25 @@ def test_door_window_states_query_has_illegal_value(vehicle_status: dict) -> Non
     assert status.right_front_door == DoorWindowState.DOOR_OPEN
     assert status.left_back_door == DoorWindowState.CLOSED
     assert status.right_back_door == DoorWindowState.UNKNOWN
+
+
+def test_door_window_states_query_has_too_few_values(vehicle_status: dict) -> None:
+    """Test various door and window states."""
+    test_json = _get_config_with_lightmode_onex_url(
+        vehicle_status,
+        "https://mysmob.api.connect.skoda-auto.cz/api/v2/vehicle-status/render?carType=LIMOUSINE&"
+        "vehicleState=1-2"
+        "&lastModifiedAt=1723053261&dimension=1x&theme=LIGHT",
+    )
+    status = Status.from_dict(test_json)
+    assert status.left_front_door == DoorWindowState.UNKNOWN
+    assert status.right_front_door == DoorWindowState.UNKNOWN
+    assert status.left_back_door == DoorWindowState.UNKNOWN
+    assert status.right_back_door == DoorWindowState.UNKNOWN
+
+
+def test_status_is_frozen(vehicle_status: dict) -> None:
+    """Test that the renders, and with them the parsed door states, cannot be replaced."""
+    status = Status.from_dict(vehicle_status)
+    with pytest.raises(FrozenInstanceError):
+        status.renders = status.renders  # pyright: ignore [reportAttributeAccessIssue]